@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
+import asyncio
 import sys
 from datetime import date, timedelta
 from pathlib import Path
@@ -10,7 +11,7 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(PROJECT_ROOT / "src"))
 
 from gas_tightness.mipi_client import NationalGasClient
-from gas_tightness.features.build_dataset import fetch_multiple_series
+from gas_tightness.features.build_dataset import afetch_multiple_series
 from gas_tightness.features.tightness import add_tightness_metrics
 from gas_tightness.report.charts import make_basic_charts
 from gas_tightness.report.render_md import write_markdown_report
@@ -32,11 +33,14 @@ def main() -> None:
         "linepack": "PUBOBJ486",  # Linepack, Hourly Actual, Aggregate, D+1
     }
 
-    daily_panel = fetch_multiple_series(
-        series_codes=series_map,
-        start_date=start.isoformat(),
-        end_date=end.isoformat(),
-        client=client,
+    # All series are fetched concurrently on one event loop
+    daily_panel = asyncio.run(
+        afetch_multiple_series(
+            series_codes=series_map,
+            start_date=start.isoformat(),
+            end_date=end.isoformat(),
+            client=client,
+        )
     )
 
     # ---- 4. Add tightness metrics (new method) ----
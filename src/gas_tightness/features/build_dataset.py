@@ -4,17 +4,88 @@ Helpers for building daily datasets from National Gas series.
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+import asyncio
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Optional
 
 import pandas as pd
 
 # Relative import: we are inside gas_tightness/features/
 from ..mipi_client import (
+    afetch_series,
     fetch_series,
     latest_per_gas_day,
     NationalGasClient,
 )
 
+if TYPE_CHECKING:
+    # httpx is only imported at runtime by afetch_multiple_series()
+    import httpx
+
+
+def _fetch_daily(
+    pub_id: str,
+    start_date: str,
+    end_date: str,
+    client: Optional[NationalGasClient],
+) -> pd.DataFrame:
+    if client is None:
+        # Old behaviour (no caching): use raw helpers directly
+        df = fetch_series(pub_id, start_date, end_date)
+        return latest_per_gas_day(df)
+
+    # New behaviour (with caching): go via the client
+    # daily has columns ["gas_day_start_utc", "Value"]
+    return client.get_daily_series(
+        series_code=pub_id,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+
+async def _afetch_daily(
+    http: httpx.AsyncClient,
+    pub_id: str,
+    start_date: str,
+    end_date: str,
+    client: Optional[NationalGasClient],
+) -> pd.DataFrame:
+    if client is None:
+        df = await afetch_series(http, pub_id, start_date, end_date)
+        return latest_per_gas_day(df)
+
+    return await client.aget_daily_series(
+        http,
+        series_code=pub_id,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+
+def _combine_series(
+    series_codes: Dict[str, str],
+    results: Dict[str, pd.DataFrame],
+) -> pd.DataFrame:
+    frames = []
+
+    # Keep the caller's column order regardless of completion order
+    for col_name in series_codes:
+        # Rename 'Value' -> desired column name, indexed by gas day
+        daily = (
+            results[col_name]
+            .rename(columns={"Value": col_name})
+            .set_index("gas_day_start_utc")
+            .sort_index()
+        )
+        # Identical dtypes so alignment never has to coerce
+        daily.index = daily.index.astype("datetime64[ns, UTC]")
+        daily[col_name] = daily[col_name].astype("float32")
+        frames.append(daily)
+
+    # Align all series on gas_day_start_utc in one pass
+    return pd.concat(frames, axis=1, join="outer", sort=True)
+
 
 def fetch_multiple_series(
     series_codes: Dict[str, str],
@@ -23,36 +94,48 @@ def fetch_multiple_series(
     client: Optional[NationalGasClient] = None,
 ) -> pd.DataFrame:
     
-    frames = []
+    if not series_codes:
+        raise ValueError("No series provided to fetch_multiple_series")
 
-    for col_name, pub_id in series_codes.items():
-        if client is None:
-            # Old behaviour (no caching): use raw helpers directly
-            df = fetch_series(pub_id, start_date, end_date)
-            daily = latest_per_gas_day(df)
-        else:
-            # New behaviour (with caching): go via the client
-            # daily has columns ["gas_day_start_utc", "Value"]
-            daily = client.get_daily_series(
-                series_code=pub_id,
-                start_date=start_date,
-                end_date=end_date,
-            )
+    # Requests are I/O-bound, so fetch every series concurrently
+    with ThreadPoolExecutor(max_workers=len(series_codes)) as pool:
+        futures = {
+            col_name: pool.submit(_fetch_daily, pub_id, start_date, end_date, client)
+            for col_name, pub_id in series_codes.items()
+        }
+        results = {col_name: fut.result() for col_name, fut in futures.items()}
 
-        # Rename 'Value' -> desired column name
-        daily = daily.rename(columns={"Value": col_name})
-        frames.append(daily)
+    return _combine_series(series_codes, results)
 
-    if not frames:
-        raise ValueError("No series provided to fetch_multiple_series")
 
-    # Merge all series on gas_day_start_utc
-    combined = frames[0]
-    for other in frames[1:]:
-        combined = combined.merge(other, on="gas_day_start_utc", how="outer")
+async def afetch_multiple_series(
+    series_codes: Dict[str, str],
+    start_date: str,
+    end_date: str,
+    client: Optional[NationalGasClient] = None,
+) -> pd.DataFrame:
+    """
+    Async fetch_multiple_series(): all series are downloaded on one event
+    loop over a shared connection (HTTP/2 if 'h2' is installed).
+
+    Use this from scripts via asyncio.run(); fetch_multiple_series() stays
+    available for callers that already run an event loop (e.g. notebooks).
+    """
+    if not series_codes:
+        raise ValueError("No series provided to afetch_multiple_series")
 
-    # Sort by time and set index
-    combined = combined.sort_values("gas_day_start_utc")
-    combined = combined.set_index("gas_day_start_utc")
+    # Imported here so the sync / notebook path never needs httpx installed
+    import httpx
+
+    async with httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        timeout=60,
+    ) as http:
+        frames = await asyncio.gather(
+            *(
+                _afetch_daily(http, pub_id, start_date, end_date, client)
+                for pub_id in series_codes.values()
+            )
+        )
 
-    return combined
+    return _combine_series(series_codes, dict(zip(series_codes, frames)))
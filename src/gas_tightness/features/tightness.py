@@ -2,6 +2,108 @@ from __future__ import annotations
 
 import numpy as np
 import pandas as pd
+from numba import njit
+
+
+@njit(cache=True)
+def _welford_add(x, count, mean, m2):
+    count += 1
+    delta = x - mean
+    mean += delta / count
+    m2 += delta * (x - mean)
+    return count, mean, m2
+
+
+@njit(cache=True)
+def _welford_remove(x, count, mean, m2):
+    count -= 1
+    if count == 0:
+        return 0, 0.0, 0.0
+    delta = x - mean
+    mean -= delta / count
+    m2 -= delta * (x - mean)
+    return count, mean, m2
+
+
+@njit(cache=True)
+def _clip(x, bound):
+    # Comparisons with NaN are False, so NaN passes through unchanged
+    if x > bound:
+        return bound
+    if x < -bound:
+        return -bound
+    return x
+
+
+@njit(cache=True)
+def _tightness_kernel(forecast, demand, linepack, window, min_periods, w_imb, w_lp):
+    """
+    Single pass over the daily arrays computing imbalance, normalised
+    imbalance, linepack z-score and the weighted score.
+
+    Rolling stats follow pandas' rolling(window, min_periods) semantics:
+    NaNs are skipped and do not count towards min_periods, and the std is
+    the sample (ddof=1) std. Running mean/variance use Welford updates.
+
+    A flat linepack window has zero std and gives NaN, as in pandas. Flat
+    windows are detected the way pandas does it (a run of identical values
+    covering the window), and variance below a relative epsilon is also
+    treated as zero, since add/remove updates leave rounding residue in m2.
+    """
+    n = forecast.shape[0]
+    imbalance_raw = np.empty(n)
+    imbalance_norm = np.empty(n)
+    linepack_dev = np.empty(n)
+    score = np.empty(n)
+
+    d_count, d_mean, d_m2 = 0, 0.0, 0.0
+    lp_count, lp_mean, lp_m2 = 0, 0.0, 0.0
+    # Length of the current run of identical (non-NaN) linepack values
+    lp_prev, lp_run = np.nan, 0
+
+    for i in range(n):
+        # Slide both windows forward to cover [i - window + 1, i]
+        if not np.isnan(demand[i]):
+            d_count, d_mean, d_m2 = _welford_add(demand[i], d_count, d_mean, d_m2)
+        if not np.isnan(linepack[i]):
+            lp_count, lp_mean, lp_m2 = _welford_add(linepack[i], lp_count, lp_mean, lp_m2)
+            lp_run = lp_run + 1 if linepack[i] == lp_prev else 1
+            lp_prev = linepack[i]
+        if i >= window:
+            j = i - window
+            if not np.isnan(demand[j]):
+                d_count, d_mean, d_m2 = _welford_remove(demand[j], d_count, d_mean, d_m2)
+            if not np.isnan(linepack[j]):
+                lp_count, lp_mean, lp_m2 = _welford_remove(
+                    linepack[j], lp_count, lp_mean, lp_m2
+                )
+
+        # ---------- Forecast imbalance, normalised by rolling mean demand ----------
+        imb = forecast[i] - demand[i]
+        imbalance_raw[i] = imb
+
+        imb_norm = np.nan
+        if d_count > 0 and d_count >= min_periods and d_mean != 0.0:
+            imb_norm = _clip(imb / d_mean, 5.0)
+        imbalance_norm[i] = imb_norm
+
+        # ---------- Linepack deviation ----------
+        lp_dev = np.nan
+        if lp_count > 1 and lp_count >= min_periods and lp_run < lp_count:
+            var = lp_m2 / (lp_count - 1)
+            if var > 1e-12 * lp_mean * lp_mean:
+                lp_dev = _clip((linepack[i] - lp_mean) / np.sqrt(var), 5.0)
+        linepack_dev[i] = lp_dev
+
+        # ---------- Weighted score (missing components count as 0) ----------
+        s = 0.0
+        if not np.isnan(imb_norm):
+            s += w_imb * imb_norm
+        if not np.isnan(lp_dev):
+            s += w_lp * lp_dev
+        score[i] = s
+
+    return imbalance_raw, imbalance_norm, linepack_dev, score
 
 
 def add_tightness_metrics(
@@ -46,23 +148,11 @@ def add_tightness_metrics(
         - imbalance_norm
         - linepack_dev
         - tightness_score
-        - tightness_label
+        - tightness_label (categorical: short / neutral / long)
     """
     df = df.copy()
 
-    # ---------- 1) Forecast imbalance ----------
-    df["imbalance_raw"] = df["forecast_39"] - df["actual_demand"]
-
-    # ---------- 2) Normalise imbalance by rolling mean demand ----------
-    demand_roll = df["actual_demand"].rolling(
-        window_days,
-        min_periods=window_days // 2,
-    ).mean()
-
-    df["imbalance_norm"] = df["imbalance_raw"] / demand_roll.replace(0, np.nan)
-    df["imbalance_norm"] = df["imbalance_norm"].clip(-5, 5)
-
-    # ---------- 3) Linepack deviation (if available) ----------
+    # ---------- 1) Linepack (if available) ----------
     has_linepack = (
         use_linepack_if_available
         and "linepack" in df.columns
@@ -70,43 +160,42 @@ def add_tightness_metrics(
     )
 
     if has_linepack:
-        lp_mean = df["linepack"].rolling(
-            window_days,
-            min_periods=window_days // 2,
-        ).mean()
-        lp_std = df["linepack"].rolling(
-            window_days,
-            min_periods=window_days // 2,
-        ).std()
-
-        df["linepack_dev"] = (df["linepack"] - lp_mean) / lp_std.replace(0, np.nan)
-        df["linepack_dev"] = df["linepack_dev"].clip(-5, 5)
+        linepack = df["linepack"].to_numpy(dtype=np.float64)
 
         # Weight imbalance more than linepack
         w_imb = 0.7
         w_lp = 0.3
     else:
-        # No linepack available: set dev to 0 and ignore in scoring
-        df["linepack_dev"] = 0.0
+        # No linepack available: ignore it in scoring
+        linepack = np.full(len(df), np.nan)
         w_imb = 1.0
         w_lp = 0.0
 
-    # ---------- 4) Combine into a single score ----------
-    df["tightness_score"] = (
-        w_imb * df["imbalance_norm"].fillna(0.0)
-        + w_lp * df["linepack_dev"].fillna(0.0)
+    # ---------- 2) Imbalance, linepack deviation and score in one pass ----------
+    imbalance_raw, imbalance_norm, linepack_dev, score = _tightness_kernel(
+        df["forecast_39"].to_numpy(dtype=np.float64),
+        df["actual_demand"].to_numpy(dtype=np.float64),
+        linepack,
+        window_days,
+        window_days // 2,
+        w_imb,
+        w_lp,
     )
 
-    # ---------- 5) Score -> label ----------
-    def label_from_score(x: float) -> str:
-        if np.isnan(x):
-            return "neutral"
-        if x >= 0.75:
-            return "long"
-        if x <= -0.75:
-            return "short"
-        return "neutral"
-
-    df["tightness_label"] = df["tightness_score"].apply(label_from_score)
+    df["imbalance_raw"] = imbalance_raw
+    df["imbalance_norm"] = imbalance_norm
+    # Without linepack the deviation is reported as 0 rather than NaN
+    df["linepack_dev"] = linepack_dev if has_linepack else 0.0
+    df["tightness_score"] = score
+
+    # ---------- 3) Score -> label ----------
+    labels = np.select(
+        [np.isnan(score), score >= 0.75, score <= -0.75],
+        ["neutral", "long", "short"],
+        default="neutral",
+    )
+    df["tightness_label"] = pd.Categorical(
+        labels, categories=["short", "neutral", "long"]
+    )
 
     return df
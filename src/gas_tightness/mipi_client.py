@@ -4,16 +4,21 @@ Simple client for pulling National Gas publication data.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, time
-from io import StringIO
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Union
-from zoneinfo import ZoneInfo
+from typing import TYPE_CHECKING, Awaitable, Callable, List, Optional, Tuple, Union
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
 import requests
 
+if TYPE_CHECKING:
+    # Type hints only: the async path is handed its client by the caller,
+    # so the sync / notebook path never needs httpx installed
+    import httpx
+
 # ---------------------------------------------------------------------------
 # Project / data locations
 # ---------------------------------------------------------------------------
@@ -24,27 +29,97 @@ RAW_DIR = DATA_DIR / "raw"
 
 DateLike = Union[str, "pd.Timestamp"]
 
+# Cache layout: RAW_DIR/<level>/series=<code>/year=<yyyy>/part-0.parquet
+CACHE_PARTITIONING = ds.partitioning(
+    pa.schema([("series", pa.string()), ("year", pa.int32())]),
+    flavor="hive",
+)
+YEAR_PARTITIONING = ds.partitioning(
+    pa.schema([("year", pa.int32())]),
+    flavor="hive",
+)
+
+# Snappy pages with dictionary + RLE/bit-packed encodings (data page v2)
+CACHE_WRITE_OPTIONS = dict(
+    compression="snappy",
+    use_dictionary=True,
+    write_statistics=True,
+    data_page_version="2.0",
+)
+CACHE_ROWS_PER_GROUP = 128_000
+
+# Fixed on-disk schema per cache level: only the columns used downstream
+# are cached, so every year partition has identical types regardless of
+# what pyarrow inferred for a particular CSV download
+CACHE_SCHEMAS = {
+    "raw": pa.schema(
+        [
+            ("Applicable At", pa.timestamp("ns")),
+            ("Value", pa.float32()),
+            ("gas_day_start_utc", pa.timestamp("ns", tz="UTC")),
+        ]
+    ),
+    "daily": pa.schema(
+        [
+            ("gas_day_start_utc", pa.timestamp("ns", tz="UTC")),
+            ("Value", pa.float32()),
+        ]
+    ),
+}
+
+# Matching pandas dtypes: frames are cast to these before any concat, so
+# cached (ns from parquet) and freshly parsed rows (us under pandas 3)
+# never mix timestamp units and degrade to object columns
+CACHE_DTYPES = {
+    "raw": {
+        "Applicable At": "datetime64[ns]",
+        "Value": "float32",
+        "gas_day_start_utc": "datetime64[ns, UTC]",
+    },
+    "daily": {
+        "gas_day_start_utc": "datetime64[ns, UTC]",
+        "Value": "float32",
+    },
+}
+
+
+def _to_cache_dtypes(level: str, df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Keep only the cached columns of df, cast to the level's dtypes.
+    """
+    dtypes = CACHE_DTYPES[level]
+    return df[list(dtypes)].astype(dtypes)
+
+
+def _gas_day_start_utc(gas_days) -> pd.DatetimeIndex:
+    """
+    Map gas days (midnight datetimes) to their 05:00 UK local start, in UTC.
+    """
+    # 05:00 UK local time never falls inside a DST transition
+    start_local = (pd.DatetimeIndex(gas_days) + pd.Timedelta(hours=5)).tz_localize(
+        "Europe/London",
+        nonexistent="shift_forward",
+        ambiguous="NaT",
+    )
+    return start_local.tz_convert("UTC")
+
+
 # ---------------------------------------------------------------------------
-# Original helper functions (unchanged)
+# API fetch / CSV parsing helpers
 # ---------------------------------------------------------------------------
 
 
-def fetch_series(series_code, start_date, end_date):
-    """
-    Fetch one National Gas data series for a date range.
+# API endpoint for publication data
+API_URL = "https://data.nationalgas.com/api/find-gas-data-download"
 
-    Returns a cleaned DataFrame with:
-    - Applicable For (gas day)
-    - Applicable At (timestamp)
-    - Value (the data point)
-    - gas_day_start_utc (aligned to 05:00 UK time)
-    """
+# Date formats used in the API CSV, e.g. "07/12/2024 12:00:00", "10/12/2024"
+TIMESTAMP_FORMAT = "%d/%m/%Y %H:%M:%S"
+GAS_DAY_FORMAT = "%d/%m/%Y"
 
-    # API endpoint for publication data
-    url = "https://data.nationalgas.com/api/find-gas-data-download"
 
+def _query_params(series_code, start_date, end_date) -> dict:
     # Query parameters for the API call
-    params = {
+    return {
         "ids": series_code,
         "dateFrom": f"{start_date}T00:00:00",
         "dateTo": f"{end_date}T23:59:59",
@@ -54,35 +129,87 @@ def fetch_series(series_code, start_date, end_date):
         "type": "CSV",             # Response format
     }
 
-    # --- 1. Download CSV text ---
-    response = requests.get(url, params=params)
-    response.raise_for_status()
-    csv_text = response.text
 
-    # --- 2. Convert CSV to DataFrame ---
-    df = pd.read_csv(StringIO(csv_text))
+def _parse_csv(content: bytes) -> pd.DataFrame:
+    """
+    Turn a downloaded CSV payload into the cleaned fetch_series() frame.
 
-    # --- 3. Clean timestamps (day/month/year in the CSV) ---
-    df["Applicable For"] = pd.to_datetime(
-        df["Applicable For"], dayfirst=True
-    ).dt.date
-    df["Applicable At"] = pd.to_datetime(
-        df["Applicable At"], dayfirst=True
+    The download itself happens in the callers, fetch_series() and
+    afetch_series(); the steps below cover parsing and cleaning only.
+    """
+
+    # --- 1. Convert CSV to DataFrame (parsed by pyarrow, no str decode) ---
+    table = pacsv.read_csv(
+        pa.BufferReader(content),
+        convert_options=pacsv.ConvertOptions(
+            # Timestamps are day-first; parsed explicitly below
+            column_types={
+                "Applicable At": pa.string(),
+                "Applicable For": pa.string(),
+            },
+        ),
     )
+    df = table.to_pandas(self_destruct=True)
 
-    # --- 4. Add gas day start timestamp in UTC ---
-    local = ZoneInfo("Europe/London")
+    # Values are well within float32 precision; halve the bytes carried
+    df["Value"] = pd.to_numeric(df["Value"], downcast="float")
 
-    def gas_day_start_utc(date_obj):
-        # Gas day starts at 05:00 UK local time
-        dt_local = datetime.combine(date_obj, time(5, 0)).replace(tzinfo=local)
-        return dt_local.astimezone(ZoneInfo("UTC"))
+    # --- 2. Clean timestamps (day/month/year in the CSV) ---
+    # Fixed formats skip per-value inference; a format change raises
+    gas_days = pd.to_datetime(
+        df["Applicable For"], format=GAS_DAY_FORMAT, errors="raise"
+    )
+    df["Applicable For"] = gas_days
+    df["Applicable At"] = pd.to_datetime(
+        df["Applicable At"], format=TIMESTAMP_FORMAT, errors="raise"
+    )
 
-    df["gas_day_start_utc"] = df["Applicable For"].apply(gas_day_start_utc)
+    # --- 3. Add gas day start timestamp in UTC ---
+    df["gas_day_start_utc"] = _gas_day_start_utc(gas_days)
 
     return df
 
 
+def fetch_series(series_code, start_date, end_date, session=None):
+    """
+    Fetch one National Gas data series for a date range.
+
+    If a requests.Session is given it is used for the download, so repeated
+    calls reuse the same keep-alive connection.
+
+    Returns a cleaned DataFrame with:
+    - Applicable For (gas day)
+    - Applicable At (timestamp)
+    - Value (the data point)
+    - gas_day_start_utc (aligned to 05:00 UK time)
+    """
+
+    # --- Download CSV bytes, then parse + clean in _parse_csv() ---
+    get = requests.get if session is None else session.get
+    response = get(API_URL, params=_query_params(series_code, start_date, end_date))
+    response.raise_for_status()
+
+    return _parse_csv(response.content)
+
+
+async def afetch_series(
+    client: httpx.AsyncClient, series_code, start_date, end_date
+) -> pd.DataFrame:
+    """
+    Async fetch_series(): download with a shared httpx.AsyncClient.
+
+    Returns the same cleaned DataFrame as fetch_series().
+    """
+
+    # --- Download CSV bytes, then parse + clean in _parse_csv() ---
+    response = await client.get(
+        API_URL, params=_query_params(series_code, start_date, end_date)
+    )
+    response.raise_for_status()
+
+    return _parse_csv(response.content)
+
+
 def latest_per_gas_day(df: pd.DataFrame) -> pd.DataFrame:
     """
     Reduce a raw series to one value per gas day (latest timestamp).
@@ -93,12 +220,14 @@ def latest_per_gas_day(df: pd.DataFrame) -> pd.DataFrame:
     """
 
     # Sort so the last publication for each day is the most recent
+    # (pandas' multi-key sort is a lexsort, already stable on ties)
     df_sorted = df.sort_values(["gas_day_start_utc", "Applicable At"])
 
-    latest = df_sorted.groupby("gas_day_start_utc").tail(1)
+    # After the sort the latest row is simply the last of each gas day run
+    latest = df_sorted.drop_duplicates("gas_day_start_utc", keep="last")
 
     # Keep just the timestamp + value
-    return latest[["gas_day_start_utc", "Value"]]
+    return latest[["gas_day_start_utc", "Value"]].reset_index(drop=True)
 
 
 # ---------------------------------------------------------------------------
@@ -110,23 +239,237 @@ def latest_per_gas_day(df: pd.DataFrame) -> pd.DataFrame:
 class NationalGasClient:
     """
     Thin wrapper around the National Gas API + existing helpers,
-    with simple parquet caching in data/raw.
+    with parquet caching in data/raw.
+
+    Cached rows are stored per gas day in a Hive-partitioned dataset
+    (series / year), so any date range can be served from the days already
+    on disk and only the missing gas days are pulled from the API.
+
+    Freshness rule: gas days within refresh_days of today (UK local date)
+    are always refetched, even when cached, so late or revised latest
+    publications (e.g. actual demand) replace what was first downloaded.
+    Older gas days are served from cache until force_refresh is passed.
     """
 
     use_cache: bool = True
+    refresh_days: int = 5
+    _session: requests.Session = field(
+        default_factory=requests.Session, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        # CSV payloads compress well; ask the server to gzip them
+        self._session.headers["Accept-Encoding"] = "gzip"
+
+    def _cache_root(self, level: str) -> Path:
+        # level is "raw" or "daily"
+        return RAW_DIR / level
 
-    def _cache_path(
+    def _read_cache(
         self,
+        level: str,
+        series_code: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Cached rows for one series with gas_day_start_utc in [start, end].
+
+        Files are read against the level's fixed schema, so only the cached
+        columns are loaded and older files with extra columns still open.
+        """
+        series_dir = self._cache_root(level) / f"series={series_code}"
+        if not series_dir.exists():
+            return None
+
+        # Open just this series' directory so concurrent writers of other
+        # series never show up in file discovery
+        dataset = ds.dataset(
+            series_dir,
+            schema=CACHE_SCHEMAS[level].append(pa.field("year", pa.int32())),
+            format="parquet",
+            partitioning=YEAR_PARTITIONING,
+        )
+        years = list(range(start.year, end.year + 1))
+        table = dataset.to_table(
+            columns=CACHE_SCHEMAS[level].names,
+            filter=(
+                ds.field("year").isin(years)
+                & (ds.field("gas_day_start_utc") >= pa.scalar(start))
+                & (ds.field("gas_day_start_utc") <= pa.scalar(end))
+            )
+        )
+        return _to_cache_dtypes(level, table.to_pandas())
+
+    def _write_cache(self, level: str, series_code: str, df: pd.DataFrame) -> None:
+        """
+        Upsert rows into the cache, rewriting only the touched year partitions.
+        """
+        if df.empty:
+            return
+
+        schema = CACHE_SCHEMAS[level]
+        df = _to_cache_dtypes(level, df)
+
+        gas_days = df["gas_day_start_utc"]
+        years = gas_days.dt.year
+        existing = self._read_cache(
+            level,
+            series_code,
+            pd.Timestamp(f"{years.min()}-01-01", tz="UTC"),
+            pd.Timestamp(f"{years.max() + 1}-01-01", tz="UTC"),
+        )
+        if existing is not None and not existing.empty:
+            # New rows replace whatever was cached for the same gas days
+            existing = existing[~existing["gas_day_start_utc"].isin(gas_days)]
+            df = pd.concat([existing, df], ignore_index=True)
+
+        df = df.assign(
+            series=series_code,
+            year=df["gas_day_start_utc"].dt.year.astype("int32"),
+        )
+        table = pa.Table.from_pandas(
+            df,
+            schema=schema.append(pa.field("series", pa.string())).append(
+                pa.field("year", pa.int32())
+            ),
+            preserve_index=False,
+        )
+
+        ds.write_dataset(
+            table,
+            self._cache_root(level),
+            format="parquet",
+            partitioning=CACHE_PARTITIONING,
+            basename_template="part-{i}.parquet",
+            existing_data_behavior="delete_matching",
+            file_options=ds.ParquetFileFormat().make_write_options(
+                **CACHE_WRITE_OPTIONS
+            ),
+            max_rows_per_group=CACHE_ROWS_PER_GROUP,
+        )
+
+    def _refresh_from(self) -> pd.Timestamp:
+        """
+        Start (UTC) of the oldest gas day that is always refetched.
+        """
+        today = pd.Timestamp.now(tz="Europe/London").tz_localize(None).normalize()
+        return _gas_day_start_utc([today - pd.Timedelta(days=self.refresh_days)])[0]
+
+    def _cache_lookup(
+        self,
+        level: str,
+        series_code: str,
+        start_date: DateLike,
+        end_date: DateLike,
+        force_refresh: bool,
+    ) -> Tuple[Optional[pd.DataFrame], List[Tuple[str, str]]]:
+        """
+        Split [start_date, end_date] into cached rows and spans to fetch.
+
+        Returns (cached, spans): each span is an (inclusive, YYYY-MM-DD) run
+        of consecutive gas days still to pull from the API; spans is empty
+        on a full cache hit.
+        """
+        expected = _gas_day_start_utc(
+            pd.date_range(
+                pd.to_datetime(start_date).normalize(),
+                pd.to_datetime(end_date).normalize(),
+                freq="D",
+            )
+        )
+
+        if not self.use_cache or expected.empty:
+            return None, [(str(start_date), str(end_date))]
+
+        cached = None
+        if not force_refresh:
+            cached = self._read_cache(level, series_code, expected[0], expected[-1])
+
+        if cached is None:
+            missing = expected
+        else:
+            missing = expected.difference(pd.DatetimeIndex(cached["gas_day_start_utc"]))
+            # Recent gas days may still be revised: treat them as missing
+            missing = missing.union(expected[expected >= self._refresh_from()])
+            if missing.empty:
+                return cached.sort_values("gas_day_start_utc", ignore_index=True), []
+
+        # Fetch each run of consecutive missing gas days separately, so an
+        # old gap never drags already-cached days after it into the request
+        local_days = missing.tz_convert("Europe/London").tz_localize(None).normalize()
+        runs: List[List[pd.Timestamp]] = []
+        for day in local_days:
+            if runs and day - runs[-1][1] == pd.Timedelta(days=1):
+                runs[-1][1] = day
+            else:
+                runs.append([day, day])
+        return cached, [(f"{a:%Y-%m-%d}", f"{b:%Y-%m-%d}") for a, b in runs]
+
+    def _cache_update(
+        self,
+        level: str,
+        series_code: str,
+        cached: Optional[pd.DataFrame],
+        fresh: pd.DataFrame,
+    ) -> pd.DataFrame:
+        """
+        Store freshly fetched rows and merge them with the cached ones.
+
+        Only the cached columns are stored and returned.
+        """
+        if self.use_cache:
+            self._write_cache(level, series_code, fresh)
+        fresh = _to_cache_dtypes(level, fresh)
+
+        if cached is None:
+            return fresh
+
+        cached = cached[~cached["gas_day_start_utc"].isin(fresh["gas_day_start_utc"])]
+        combined = pd.concat([cached, fresh], ignore_index=True)
+        return combined.sort_values("gas_day_start_utc", ignore_index=True)
+
+    def _get_cached(
+        self,
+        level: str,
+        series_code: str,
+        start_date: DateLike,
+        end_date: DateLike,
+        force_refresh: bool,
+        fetch: Callable[[str, str], pd.DataFrame],
+    ) -> pd.DataFrame:
+        """
+        Serve [start_date, end_date] from cache, fetching only missing gas days.
+
+        fetch(start, end) pulls the given (inclusive, YYYY-MM-DD) gas days.
+        """
+        cached, spans = self._cache_lookup(
+            level, series_code, start_date, end_date, force_refresh
+        )
+        if not spans:
+            return cached
+        fresh = pd.concat([fetch(*span) for span in spans], ignore_index=True)
+        return self._cache_update(level, series_code, cached, fresh)
+
+    async def _aget_cached(
+        self,
+        level: str,
         series_code: str,
         start_date: DateLike,
         end_date: DateLike,
-        level: str = "raw",  # "raw" or "daily"
-    ) -> Path:
-        start_str = pd.to_datetime(start_date).date().isoformat()
-        end_str = pd.to_datetime(end_date).date().isoformat()
-        RAW_DIR.mkdir(parents=True, exist_ok=True)
-        fname = f"{series_code}_{level}_{start_str}_{end_str}.parquet"
-        return RAW_DIR / fname
+        force_refresh: bool,
+        afetch: Callable[[str, str], Awaitable[pd.DataFrame]],
+    ) -> pd.DataFrame:
+        """
+        Async _get_cached(); cache hits return without awaiting anything.
+        """
+        cached, spans = self._cache_lookup(
+            level, series_code, start_date, end_date, force_refresh
+        )
+        if not spans:
+            return cached
+        fresh = pd.concat([await afetch(*span) for span in spans], ignore_index=True)
+        return self._cache_update(level, series_code, cached, fresh)
 
     def get_raw_series(
         self,
@@ -137,18 +480,21 @@ class NationalGasClient:
     ) -> pd.DataFrame:
         """
         Use the existing fetch_series() but cache the result.
-        """
-        cache_path = self._cache_path(series_code, start_date, end_date, level="raw")
-
-        if self.use_cache and not force_refresh and cache_path.exists():
-            return pd.read_parquet(cache_path)
 
-        df = fetch_series(series_code, start_date, end_date)
+        Returns only the columns used downstream (CACHE_SCHEMAS["raw"]).
+        """
 
-        if self.use_cache:
-            df.to_parquet(cache_path)
+        def fetch(start: str, end: str) -> pd.DataFrame:
+            return fetch_series(series_code, start, end, session=self._session)
 
-        return df
+        return self._get_cached(
+            "raw",
+            series_code,
+            start_date,
+            end_date,
+            force_refresh,
+            fetch,
+        )
 
     def get_daily_series(
         self,
@@ -160,20 +506,76 @@ class NationalGasClient:
         """
         One value per gas day (using latest_per_gas_day), also cached.
         """
-        cache_path = self._cache_path(series_code, start_date, end_date, level="daily")
 
-        if self.use_cache and not force_refresh and cache_path.exists():
-            return pd.read_parquet(cache_path)
+        def fetch(start: str, end: str) -> pd.DataFrame:
+            raw = self.get_raw_series(
+                series_code,
+                start,
+                end,
+                force_refresh=force_refresh,
+            )
+            return latest_per_gas_day(raw)
+
+        return self._get_cached(
+            "daily",
+            series_code,
+            start_date,
+            end_date,
+            force_refresh,
+            fetch,
+        )
+
+    async def aget_raw_series(
+        self,
+        client: httpx.AsyncClient,
+        series_code: str,
+        start_date: DateLike,
+        end_date: DateLike,
+        force_refresh: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Async get_raw_series(), downloading through the given httpx client.
+        """
+
+        async def afetch(start: str, end: str) -> pd.DataFrame:
+            return await afetch_series(client, series_code, start, end)
 
-        raw = self.get_raw_series(
+        return await self._aget_cached(
+            "raw",
             series_code,
             start_date,
             end_date,
-            force_refresh=force_refresh,
+            force_refresh,
+            afetch,
         )
-        daily = latest_per_gas_day(raw)
 
-        if self.use_cache:
-            daily.to_parquet(cache_path)
+    async def aget_daily_series(
+        self,
+        client: httpx.AsyncClient,
+        series_code: str,
+        start_date: DateLike,
+        end_date: DateLike,
+        force_refresh: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Async get_daily_series(), downloading through the given httpx client.
+        """
 
-        return daily
+        async def afetch(start: str, end: str) -> pd.DataFrame:
+            raw = await self.aget_raw_series(
+                client,
+                series_code,
+                start,
+                end,
+                force_refresh=force_refresh,
+            )
+            return latest_per_gas_day(raw)
+
+        return await self._aget_cached(
+            "daily",
+            series_code,
+            start_date,
+            end_date,
+            force_refresh,
+            afetch,
+        )
@@ -4,8 +4,14 @@ from datetime import date
 from pathlib import Path
 from typing import Dict
 
+import matplotlib
+
+# Charts are only ever written to disk: use the non-interactive backend
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+import numpy as np
 import pandas as pd
 
 
@@ -55,13 +61,24 @@ def make_basic_charts(
     # Work on a copy, sorted by date
     df = scored_df.copy().sort_index()
 
+    # Convert the dates once; matplotlib then skips its per-call conversion
+    x_num = mdates.date2num(df.index.to_pydatetime())
+
+    # One figure is reused for every chart; axes are cleared in between
+    fig, ax = plt.subplots()
+
     # ------------------------------------------------------------------
     # 1) Demand forecast vs actual
     # ------------------------------------------------------------------
-    fig, ax = plt.subplots()
+    forecast = df["forecast_39"].to_numpy(dtype=np.float64)
+    actual = df["actual_demand"].to_numpy(dtype=np.float64)
+
+    # Skip days where neither series is present
+    demand_mask = np.isfinite(forecast) | np.isfinite(actual)
+    x_demand = x_num[demand_mask]
 
-    demand_df = df[["forecast_39", "actual_demand"]].dropna(how="all")
-    demand_df.plot(ax=ax)
+    ax.plot(x_demand, forecast[demand_mask], label="forecast_39")
+    ax.plot(x_demand, actual[demand_mask], label="actual_demand")
 
     ax.set_title(f"Demand forecast vs outturn (up to {report_date:%Y-%m-%d})")
     ax.set_xlabel("gas_day_start_utc")
@@ -72,33 +89,34 @@ def make_basic_charts(
 
     path_supply = reports_dir / f"supply_vs_demand_{report_date:%Y%m%d}.png"
     fig.savefig(path_supply, bbox_inches="tight")
-    plt.close(fig)
+    ax.cla()
     chart_paths["supply_vs_demand"] = path_supply
 
     # ------------------------------------------------------------------
     # 2) Imbalance and tightness score
     # ------------------------------------------------------------------
-    fig, ax1 = plt.subplots()
+    imbalance = df["imbalance_raw"].to_numpy(dtype=np.float64)
+    score = df["tightness_score"].to_numpy(dtype=np.float64)
 
     # Only plot days where both series are present
-    mask = df["imbalance_raw"].notna() & df["tightness_score"].notna()
-    df_imb = df.loc[mask]
+    mask = np.isfinite(imbalance) & np.isfinite(score)
+    x_imb = x_num[mask]
 
-    line1, = ax1.plot(
-        df_imb.index,
-        df_imb["imbalance_raw"],
+    line1, = ax.plot(
+        x_imb,
+        imbalance[mask],
         label="Imbalance (forecast - actual)",
     )
-    ax1.set_title("Imbalance and tightness score")
-    ax1.set_xlabel("gas_day_start_utc")
-    ax1.set_ylabel("Imbalance (mscm/d)")
-    ax1.grid(True)
-    _format_date_axis(ax1)
+    ax.set_title("Imbalance and tightness score")
+    ax.set_xlabel("gas_day_start_utc")
+    ax.set_ylabel("Imbalance (mscm/d)")
+    ax.grid(True)
+    _format_date_axis(ax)
 
-    ax2 = ax1.twinx()
+    ax2 = ax.twinx()
     line2, = ax2.plot(
-        df_imb.index,
-        df_imb["tightness_score"],
+        x_imb,
+        score[mask],
         linestyle="--",
         label="Tightness score",
     )
@@ -107,26 +125,29 @@ def make_basic_charts(
     # Combined legend
     lines = [line1, line2]
     labels = [l.get_label() for l in lines]
-    ax1.legend(lines, labels, loc="upper left", title="Series")
+    ax.legend(lines, labels, loc="upper left", title="Series")
 
     path_imb = reports_dir / f"imbalance_and_score_{report_date:%Y%m%d}.png"
     fig.savefig(path_imb, bbox_inches="tight")
-    plt.close(fig)
+    ax2.remove()
+    ax.cla()
     chart_paths["imbalance_and_score"] = path_imb
 
     # ------------------------------------------------------------------
     # 3) Linepack vs recent normal
     # ------------------------------------------------------------------
-    fig, ax = plt.subplots()
+    linepack = df["linepack"].to_numpy(dtype=np.float64)
 
     # Drop NaNs so we don't get gaps
-    lp = df["linepack"].dropna()
-    lp_roll = lp.rolling(14, min_periods=5).mean()
+    lp_mask = np.isfinite(linepack)
+    lp = linepack[lp_mask]
+    lp_roll = pd.Series(lp).rolling(14, min_periods=5).mean().to_numpy()
+    x_lp = x_num[lp_mask]
 
-    line_lp, = ax.plot(lp.index, lp.values, label="Linepack")
+    line_lp, = ax.plot(x_lp, lp, label="Linepack")
     line_roll, = ax.plot(
-        lp_roll.index,
-        lp_roll.values,
+        x_lp,
+        lp_roll,
         linestyle="--",
         label="14-day mean",
     )
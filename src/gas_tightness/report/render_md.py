@@ -27,13 +27,11 @@ def write_markdown_report(
     out_path : Path
         Where to write the .md file.
     """
-    # Use the data as-is; no extra date filtering here either
-    df = scored_df.copy()
-
-    if df.empty:
+    # Read-only: use the data as-is, no copy and no extra date filtering
+    if scored_df.empty:
         raise ValueError("No data available for report.")
 
-    latest = df.iloc[-1]
+    latest = scored_df.iloc[-1]
 
     headline_label = str(latest.get("tightness_label", "neutral"))
     latest_score = float(latest.get("tightness_score", float("nan")))
@@ -75,10 +73,11 @@ def write_markdown_report(
         lines.append("")
 
     # ---------- Recent 7-day summary ----------
-    recent = df.last("7D").copy()
+    # Same window as the old df.last("7D"): strictly after last day - 7 days
+    cutoff = scored_df.index[-1] - pd.Timedelta(days=7)
+    recent = scored_df.loc[scored_df.index > cutoff]
     daily = (
-        recent.reset_index()
-        .groupby(recent.index.date)
+        recent.groupby(recent.index.floor("D"))
         .agg(
             tightness_score=("tightness_score", "mean"),
             tightness_label=("tightness_label", lambda x: x.tail(1).iloc[0]),
@@ -98,7 +97,7 @@ def write_markdown_report(
         lines.append(sep)
         for _, row in daily.iterrows():
             lines.append(
-                f"| {row['gas_day']} | {row['tightness_label']} | "
+                f"| {row['gas_day']:%Y-%m-%d} | {row['tightness_label']} | "
                 f"{row['tightness_score']:+.2f} | "
                 f"{row['lp_dev_min']:+.2f} | {row['lp_dev_max']:+.2f} |"
             )